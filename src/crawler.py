@@ -1,30 +1,144 @@
 """Web crawler with dual-mode support (static and JavaScript rendering)."""
 
+import asyncio
+import inspect
+import queue
+import re
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import Optional
-from urllib.parse import urljoin, urlparse
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from html import unescape
+from typing import Awaitable, Callable, Iterator, Optional, Union
+from urllib.parse import ParseResult, urljoin, urlparse
 from collections import deque
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+import lxml.html
+import zstandard
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 console = Console()
 
+# <title> almost always sits near the top of the page, so only this many bytes are scanned
+_TITLE_SCAN_BYTES = 8192
+_TITLE_RE = re.compile(rb"<title(?:\s[^>]*)?>(.*?)</title\s*>", re.IGNORECASE | re.DOTALL)
 
-@dataclass
+# Forgiving lxml parser, used only when selectolax fails
+_FALLBACK_PARSER = lxml.html.HTMLParser(encoding="utf-8", recover=True, huge_tree=False)
+
+# Minimum seconds between progress bar updates
+_PROGRESS_INTERVAL = 0.1
+
+# Responses that are retried after the server's requested wait
+_RETRY_STATUSES = frozenset({429, 503})
+# Longest a server can hold back a host; longer requested waits fail the page instead
+_MAX_RETRY_WAIT = 60.0
+
+# Seconds between checks for room in iter_crawl's buffer, or for the consumer having gone
+_HAND_OFF_POLL = 0.05
+
+
+class _ConsumerGone(Exception):
+    """Raised inside iter_crawl's crawl once the consumer has stopped iterating."""
+
+
+@lru_cache(maxsize=8192)
+def _parse_and_normalize(url: str) -> tuple[ParseResult, str]:
+    """
+    Parse an absolute URL and normalize it by removing fragments and trailing slashes.
+
+    Cached because navigation and footer links repeat on nearly every page.
+    """
+    parsed = urlparse(url)
+    # Remove fragment and normalize
+    normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+    if normalized.endswith("/") and len(parsed.path) > 1:
+        normalized = normalized.rstrip("/")
+    return parsed, normalized
+
+
+@lru_cache(maxsize=8192)
+def _canonical_key(url: str) -> str:
+    """
+    Reduce a normalized URL to a key shared by equivalent URLs.
+
+    Lowercases the scheme and host, drops default ports and a leading "www.".
+    """
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    host = parsed.netloc.lower()
+    default_port = {"http": ":80", "https": ":443"}.get(scheme)
+    if default_port and host.endswith(default_port):
+        host = host[:-len(default_port)]
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{scheme}://{host}{parsed.path}"
+
+
+def _parse_with_lxml(html: str) -> Optional[lxml.html.HtmlElement]:
+    """Parse HTML with lxml, returning None for an empty document."""
+    try:
+        return lxml.html.document_fromstring(html.encode("utf-8", "replace"), parser=_FALLBACK_PARSER)
+    except etree.ParserError:
+        return None
+
+
+def _compress_html(html: str) -> bytes:
+    """Compress page HTML for storage in PageData; empty pages stay empty."""
+    return zstandard.compress(html.encode("utf-8", "surrogatepass")) if html else b""
+
+
+def _retry_after_seconds(headers) -> Optional[float]:
+    """Seconds the server asked clients to wait, from Retry-After or X-RateLimit-* headers."""
+    retry_after = headers.get("Retry-After", "").strip()
+    if retry_after:
+        if retry_after.isdigit():
+            return float(retry_after)
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
+
+    if headers.get("X-RateLimit-Remaining", "").strip() == "0":
+        try:
+            reset = float(headers.get("X-RateLimit-Reset", ""))
+        except ValueError:
+            return None
+        # Some APIs send an epoch timestamp, others a number of seconds
+        return max(0.0, reset - time.time()) if reset > 1e9 else reset
+
+    return None
+
+
+@dataclass(slots=True)
 class PageData:
-    """Data extracted from a single page."""
+    """
+    Data extracted from a single page.
+
+    The HTML is kept zstd-compressed, since pages stay in memory for the whole
+    crawl; read it through `html_text`.
+    """
     url: str
-    html: str
+    html: bytes
     title: str = ""
     status_code: int = 200
     error: Optional[str] = None
 
+    @property
+    def html_text(self) -> str:
+        """The decompressed page HTML."""
+        if not self.html:
+            return ""
+        return zstandard.decompress(self.html).decode("utf-8", "surrogatepass")
+
 
-@dataclass
+@dataclass(slots=True)
 class CrawlerConfig:
     """Configuration for the crawler."""
     max_pages: int = 50
@@ -32,6 +146,10 @@ class CrawlerConfig:
     delay: float = 1.0
     timeout: int = 30
     use_js: bool = False
+    concurrency: int = 64
+    js_pages: int = 4
+    bloom_threshold: int = 10_000
+    max_retries: int = 2
     user_agent: str = "WebsiteScraper/1.0 (Educational purposes)"
 
 
@@ -41,137 +159,358 @@ class WebCrawler:
     def __init__(self, config: Optional[CrawlerConfig] = None):
         self.config = config or CrawlerConfig()
         self.visited: set[str] = set()
+        self._enqueued = set()
         self.pages: list[PageData] = []
         self.base_domain: str = ""
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.config.user_agent})
-        self._playwright = None
-        self._browser = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._host_next_ok: dict[str, float] = {}
+        self._on_page: Optional[Callable[[PageData], Union[None, Awaitable[None]]]] = None
+        self._warnings: list[str] = []
+
+    # File extensions (without the dot) that aren't web pages
+    _SKIP_EXTS = frozenset({
+        "pdf", "jpg", "jpeg", "png", "gif", "svg", "webp",
+        "mp3", "mp4", "avi", "mov", "zip", "tar", "gz",
+        "css", "js", "ico", "woff", "woff2", "ttf", "eot"
+    })
+    _MAX_SKIP_EXT_LEN = max(len(ext) for ext in _SKIP_EXTS)
+
+    # Resource types not needed to render page text in JavaScript mode
+    _BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "stylesheet", "media"})
+
+    # Upper bound on waiting for network idle after DOMContentLoaded
+    _JS_SETTLE_MS = 2000
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL by removing fragments and trailing slashes."""
-        parsed = urlparse(url)
-        # Remove fragment and normalize
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-        if normalized.endswith("/") and len(parsed.path) > 1:
-            normalized = normalized.rstrip("/")
-        return normalized
-
-    def _is_same_domain(self, url: str) -> bool:
-        """Check if URL belongs to the same domain."""
-        parsed = urlparse(url)
-        return parsed.netloc == self.base_domain or parsed.netloc == ""
+        return _parse_and_normalize(url)[1]
 
-    def _is_valid_url(self, url: str) -> bool:
-        """Check if URL should be crawled."""
-        parsed = urlparse(url)
+    def _is_same_domain(self, parsed: ParseResult) -> bool:
+        """Check if a parsed URL belongs to the same domain."""
+        return parsed.netloc == self.base_domain or parsed.netloc == ""
 
+    def _is_valid_url(self, parsed: ParseResult) -> bool:
+        """Check if a parsed URL should be crawled."""
         # Skip non-http(s) URLs
         if parsed.scheme and parsed.scheme not in ("http", "https"):
             return False
 
-        # Skip file extensions that aren't web pages
-        skip_extensions = (
-            ".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp",
-            ".mp3", ".mp4", ".avi", ".mov", ".zip", ".tar", ".gz",
-            ".css", ".js", ".ico", ".woff", ".woff2", ".ttf", ".eot"
-        )
-        path_lower = parsed.path.lower()
-        if any(path_lower.endswith(ext) for ext in skip_extensions):
-            return False
+        # Skip file extensions that aren't web pages (trailing slashes are
+        # dropped by normalization, so ignore them here too)
+        path = parsed.path.rstrip("/")
+        dot = path.rfind(".")
+        # Only a tail short enough to be a skipped extension is sliced and lowercased
+        if dot != -1 and len(path) - dot - 1 <= self._MAX_SKIP_EXT_LEN:
+            if path[dot + 1:].lower() in self._SKIP_EXTS:
+                return False
 
         return True
 
+    def _extract_hrefs(self, html: str) -> list[str]:
+        """Return the raw href of every anchor in the HTML."""
+        try:
+            tree = LexborHTMLParser(html)
+            return [anchor.attributes.get("href") or "" for anchor in tree.css("a[href]")]
+        except Exception:
+            root = _parse_with_lxml(html)
+            return [str(href) for href in root.xpath("//a/@href")] if root is not None else []
+
+    def _extract_title(self, html: str) -> str:
+        """Return the stripped contents of the <title> tag."""
+        try:
+            node = LexborHTMLParser(html).css_first("title")
+            return node.text().strip() if node else ""
+        except Exception:
+            root = _parse_with_lxml(html)
+            return (root.findtext(".//title") or "").strip() if root is not None else ""
+
+    def _extract_title_fast(self, body: bytes, encoding: str) -> str:
+        """Find the title near the start of the raw page, parsing the whole page only if needed."""
+        match = _TITLE_RE.search(body, 0, _TITLE_SCAN_BYTES)
+        if match:
+            return unescape(match.group(1).decode(encoding, "replace")).strip()
+        return self._extract_title(body.decode(encoding, "replace"))
+
     def _extract_links(self, html: str, base_url: str) -> list[str]:
         """Extract all internal links from HTML."""
-        soup = BeautifulSoup(html, "lxml")
         links = []
+        base_parsed = urlparse(base_url)
+        origin = f"{base_parsed.scheme}://{base_parsed.netloc}"
 
-        for anchor in soup.find_all("a", href=True):
-            href = anchor["href"].strip()
+        for href in self._extract_hrefs(html):
+            href = href.strip()
 
             # Skip empty, javascript, and mailto links
             if not href or href.startswith(("#", "javascript:", "mailto:", "tel:")):
                 continue
 
-            # Convert relative URLs to absolute
-            full_url = urljoin(base_url, href)
-            normalized = self._normalize_url(full_url)
+            # Convert relative URLs to absolute, skipping urljoin for the
+            # common absolute and root-relative forms
+            if "/." in href:
+                full_url = urljoin(base_url, href)
+            elif href.startswith(("http://", "https://")):
+                full_url = href
+            elif href.startswith("/") and not href.startswith("//"):
+                full_url = origin + href
+            else:
+                full_url = urljoin(base_url, href)
 
-            if self._is_same_domain(normalized) and self._is_valid_url(normalized):
+            parsed, normalized = _parse_and_normalize(full_url)
+
+            if self._is_same_domain(parsed) and self._is_valid_url(parsed):
                 links.append(normalized)
 
         return links
 
-    def _fetch_static(self, url: str) -> PageData:
-        """Fetch page using requests (no JavaScript rendering)."""
-        try:
-            response = self.session.get(url, timeout=self.config.timeout)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "lxml")
-            title = soup.title.string.strip() if soup.title and soup.title.string else ""
-
-            return PageData(
-                url=url,
-                html=response.text,
-                title=title,
-                status_code=response.status_code
-            )
-        except requests.RequestException as e:
-            return PageData(
-                url=url,
-                html="",
-                error=str(e),
-                status_code=getattr(e.response, "status_code", 0) if hasattr(e, "response") else 0
-            )
-
-    def _init_playwright(self):
-        """Initialize Playwright browser."""
-        if self._playwright is None:
-            from playwright.sync_api import sync_playwright
-            self._playwright = sync_playwright().start()
-            self._browser = self._playwright.chromium.launch(headless=True)
-
-    def _fetch_js(self, url: str) -> PageData:
-        """Fetch page using Playwright (with JavaScript rendering)."""
-        try:
-            self._init_playwright()
-            page = self._browser.new_page()
-            page.set_extra_http_headers({"User-Agent": self.config.user_agent})
-
-            response = page.goto(url, timeout=self.config.timeout * 1000, wait_until="networkidle")
-            html = page.content()
-            title = page.title()
-            status = response.status if response else 200
-
-            page.close()
-
-            return PageData(
-                url=url,
-                html=html,
-                title=title,
-                status_code=status
-            )
-        except Exception as e:
-            return PageData(
-                url=url,
-                html="",
-                error=str(e),
-                status_code=0
-            )
-
-    def _fetch_page(self, url: str) -> PageData:
-        """Fetch a page using configured method."""
-        if self.config.use_js:
-            return self._fetch_js(url)
-        return self._fetch_static(url)
+    async def _wait_for_host(self, host: str):
+        """Wait for the host's next free slot, then reserve the one `delay` seconds later."""
+        now = time.monotonic()
+        ready = max(now, self._host_next_ok.get(host, now))
+        self._host_next_ok[host] = ready + self.config.delay
+        if ready > now:
+            await asyncio.sleep(ready - now)
+
+    def _defer_host(self, host: str, seconds: float):
+        """Hold back every request to a host for at least `seconds`."""
+        resume = time.monotonic() + seconds
+        self._host_next_ok[host] = max(self._host_next_ok.get(host, resume), resume)
+
+    async def _fetch_static_async(self, client: httpx.AsyncClient, url: str) -> PageData:
+        """Fetch page using httpx (no JavaScript rendering)."""
+        host = urlparse(url).netloc
+
+        async with self._semaphore:
+            try:
+                for attempt in range(self.config.max_retries + 1):
+                    await self._wait_for_host(host)
+                    response = await client.get(url)
+
+                    wait = _retry_after_seconds(response.headers)
+                    if wait is not None:
+                        self._defer_host(host, min(wait, _MAX_RETRY_WAIT))
+
+                    # Rate limited: back off and retry if the wait is reasonable
+                    if response.status_code in _RETRY_STATUSES and attempt < self.config.max_retries:
+                        if wait is None:
+                            wait = max(self.config.delay, 1.0) * 2 ** attempt
+                            self._defer_host(host, wait)
+                        if wait <= _MAX_RETRY_WAIT:
+                            continue
+
+                    response.raise_for_status()
+                    break
+            except (httpx.HTTPError, httpx.InvalidURL) as e:
+                # InvalidURL (e.g. a control character in an href) isn't an HTTPError.
+                # httpx appends a documentation link on later lines; keep the summary
+                return PageData(
+                    url=url,
+                    html=b"",
+                    error=str(e).split("\n", 1)[0] or type(e).__name__,
+                    status_code=e.response.status_code if isinstance(e, httpx.HTTPStatusError) else 0
+                )
+
+        body = response.content
+        encoding = response.encoding or "utf-8"
+
+        return PageData(
+            url=url,
+            html=_compress_html(body.decode(encoding, "replace")),
+            title=self._extract_title_fast(body, encoding),
+            status_code=response.status_code
+        )
+
+    async def _block_heavy_resources(self, route):
+        """Abort requests for resources that don't affect page text."""
+        if route.request.resource_type in self._BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _fetch_js_async(self, pages: asyncio.Queue, url: str) -> PageData:
+        """Fetch page using a pooled Playwright page (with JavaScript rendering)."""
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        async with self._semaphore:
+            page = await pages.get()
+            try:
+                # Reserve the host slot only once a page is free, so the delay spaces navigations
+                await self._wait_for_host(urlparse(url).netloc)
+                response = await page.goto(
+                    url, timeout=self.config.timeout * 1000, wait_until="domcontentloaded"
+                )
+                # Give client-side rendering a short, bounded chance to settle
+                try:
+                    await page.wait_for_load_state("networkidle", timeout=self._JS_SETTLE_MS)
+                except PlaywrightTimeoutError:
+                    pass
+
+                html = await page.content()
+                title = await page.title()
+                status = response.status if response else 200
+            except Exception as e:
+                return PageData(
+                    url=url,
+                    html=b"",
+                    error=str(e),
+                    status_code=0
+                )
+            finally:
+                pages.put_nowait(page)
+
+        return PageData(
+            url=url,
+            html=_compress_html(html),
+            title=title,
+            status_code=status
+        )
+
+    def _enqueue(self, frontier: deque, url: str):
+        """Queue a URL unless an equivalent URL has been queued before."""
+        key = _canonical_key(url)
+        if key not in self._enqueued:
+            self._enqueued.add(key)
+            frontier.append(url)
+
+    def _next_batch(self, frontier: deque, size: int) -> list[str]:
+        """Pop up to `size` URLs off the frontier, marking them visited."""
+        batch = [frontier.popleft() for _ in range(min(size, len(frontier)))]
+        self.visited.update(batch)
+        return batch
+
+    def _new_url_filter(self):
+        """
+        Create the set of canonical URLs already queued.
+
+        Large crawls use a scalable Bloom filter, trading a 0.1% chance of
+        skipping an unvisited page for memory that doesn't grow with URL length.
+        """
+        if self.config.max_pages < self.config.bloom_threshold:
+            return set()
+
+        from pybloom_live import ScalableBloomFilter
+        return ScalableBloomFilter(initial_capacity=self.config.bloom_threshold, error_rate=0.001)
+
+    async def _crawl_frontier(
+        self,
+        start_url: str,
+        fetch: Callable[[str], Awaitable[PageData]],
+        progress: Progress,
+        task
+    ) -> None:
+        """
+        Breadth-first crawl that fetches each depth level concurrently.
 
-    def crawl(self, start_url: str) -> list[PageData]:
+        Pages are appended in the same order a sequential BFS would visit them.
+        """
+        frontier: deque[str] = deque()
+        next_frontier: deque[str] = deque()
+        self._enqueue(frontier, start_url)
+        depth = 0
+        last_update = 0.0
+
+        while len(self.pages) < self.config.max_pages:
+            if not frontier:
+                if not next_frontier or depth >= self.config.max_depth:
+                    break
+                frontier, next_frontier = next_frontier, deque()
+                depth += 1
+
+            batch = self._next_batch(frontier, self.config.max_pages - len(self.pages))
+            if not batch:
+                continue
+
+            progress.update(task, description=f"[cyan]Fetching {len(batch)} pages (depth {depth})...")
+            fetches = [asyncio.ensure_future(fetch(url)) for url in batch]
+
+            # Hand pages off in BFS order as soon as they and their predecessors complete
+            for pending in fetches:
+                page_data = await pending
+                if page_data.error:
+                    self._warnings.append(f"Failed to fetch {page_data.url}: {page_data.error}")
+                    continue
+
+                self.pages.append(page_data)
+                # Redrawing the progress bar per page is costly; cap it at ~10 Hz
+                now = time.monotonic()
+                if now - last_update >= _PROGRESS_INTERVAL:
+                    progress.update(task, completed=len(self.pages))
+                    last_update = now
+                if self._on_page:
+                    handed_off = self._on_page(page_data)
+                    if inspect.isawaitable(handed_off):
+                        await handed_off
+
+                # Extract and queue new links
+                if depth < self.config.max_depth:
+                    for link in self._extract_links(page_data.html_text, page_data.url):
+                        self._enqueue(next_frontier, link)
+
+        progress.update(task, completed=len(self.pages))
+
+    async def _crawl_static(self, start_url: str, progress: Progress, task) -> None:
+        """
+        Crawl with a shared httpx client (no JavaScript rendering).
+
+        HTTP/2 multiplexes requests over one connection per host, and kept-alive
+        connections avoid repeated TLS handshakes. httpx advertises every content
+        encoding it can decode (gzip, deflate, brotli, zstd).
+        """
+        limits = httpx.Limits(
+            max_connections=self.config.concurrency,
+            max_keepalive_connections=self.config.concurrency
+        )
+
+        async with httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": self.config.user_agent},
+            limits=limits,
+            timeout=self.config.timeout,
+            follow_redirects=True
+        ) as client:
+            fetch = partial(self._fetch_static_async, client)
+            await self._crawl_frontier(start_url, fetch, progress, task)
+
+    async def _crawl_js(self, start_url: str, progress: Progress, task) -> None:
+        """Crawl with one Playwright browser context and a pool of reusable pages."""
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True)
+            try:
+                context = await browser.new_context(user_agent=self.config.user_agent)
+                await context.route("**/*", self._block_heavy_resources)
+
+                pages: asyncio.Queue = asyncio.Queue()
+                for _ in range(max(1, self.config.js_pages)):
+                    pages.put_nowait(await context.new_page())
+
+                fetch = partial(self._fetch_js_async, pages)
+                await self._crawl_frontier(start_url, fetch, progress, task)
+            finally:
+                await browser.close()
+
+    async def _crawl_async(self, start_url: str, progress: Progress, task) -> None:
+        """Run the crawl with the configured fetch method."""
+        self._semaphore = asyncio.Semaphore(self.config.concurrency)
+        self._host_next_ok.clear()
+
+        if self.config.use_js:
+            await self._crawl_js(start_url, progress, task)
+        else:
+            await self._crawl_static(start_url, progress, task)
+
+    def crawl(
+        self,
+        start_url: str,
+        on_page: Optional[Callable[[PageData], Union[None, Awaitable[None]]]] = None
+    ) -> list[PageData]:
         """
         Crawl website starting from the given URL.
 
         Uses breadth-first search to discover and fetch pages.
+        If given, on_page is called with each successfully fetched page as soon as it arrives.
+        It runs inside the crawl's event loop, so it must not block; a coroutine
+        function is awaited, which pauses discovery while in-flight fetches continue.
         Returns list of PageData objects containing extracted content.
         """
         # Parse and normalize starting URL
@@ -183,10 +522,10 @@ class WebCrawler:
         self.base_domain = parsed.netloc
         start_url = self._normalize_url(start_url)
 
-        # BFS queue: (url, depth)
-        queue: deque[tuple[str, int]] = deque([(start_url, 0)])
         self.visited.clear()
+        self._enqueued = self._new_url_filter()
         self.pages.clear()
+        self._warnings.clear()
 
         console.print(f"\n[bold blue]Starting crawl of {self.base_domain}[/bold blue]")
         console.print(f"Max pages: {self.config.max_pages}, Max depth: {self.config.max_depth}")
@@ -201,47 +540,80 @@ class WebCrawler:
         ) as progress:
             task = progress.add_task("[cyan]Crawling...", total=self.config.max_pages)
 
-            while queue and len(self.pages) < self.config.max_pages:
-                url, depth = queue.popleft()
-
-                # Skip if already visited or too deep
-                if url in self.visited or depth > self.config.max_depth:
-                    continue
+            self._on_page = on_page
+            try:
+                asyncio.run(self._crawl_async(start_url, progress, task))
+            finally:
+                self._on_page = None
 
-                self.visited.add(url)
+        # Warnings are collected during the crawl so they don't contend with the progress display
+        for warning in self._warnings:
+            console.print(f"[yellow]Warning: {warning}[/yellow]")
 
-                # Fetch the page
-                progress.update(task, description=f"[cyan]Fetching: {url[:60]}...")
-                page_data = self._fetch_page(url)
+        console.print(f"\n[bold green]Crawl complete![/bold green] Fetched {len(self.pages)} pages.")
 
-                if page_data.error:
-                    console.print(f"[yellow]Warning: Failed to fetch {url}: {page_data.error}[/yellow]")
-                else:
-                    self.pages.append(page_data)
-                    progress.update(task, completed=len(self.pages))
+        return self.pages
 
-                    # Extract and queue new links
-                    if depth < self.config.max_depth:
-                        new_links = self._extract_links(page_data.html, url)
-                        for link in new_links:
-                            if link not in self.visited:
-                                queue.append((link, depth + 1))
+    def iter_crawl(self, start_url: str, prefetch: int = 8) -> Iterator[PageData]:
+        """
+        Crawl in a background thread, yielding pages as they are fetched.
 
-                # Polite delay between requests
-                if self.config.delay > 0:
-                    time.sleep(self.config.delay)
+        Lets callers process pages while the rest of the site is still downloading.
+        At most `prefetch` pages are buffered before the crawler waits for the consumer;
+        the wait doesn't block the event loop, so in-flight fetches keep running.
+        If the consumer stops early (closes the generator or raises), the crawl is
+        abandoned without leaving any thread blocked on the buffer.
+        """
+        pages: queue.Queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        done = object()
+        errors: list[BaseException] = []
+
+        async def hand_off(page_data: PageData):
+            # Poll rather than block: a blocking put would stall the event loop, and one
+            # run in an executor thread would hang interpreter exit if nobody consumes
+            while True:
+                try:
+                    pages.put_nowait(page_data)
+                    return
+                except queue.Full:
+                    if stop.is_set():
+                        raise _ConsumerGone
+                    await asyncio.sleep(_HAND_OFF_POLL)
+
+        def run():
+            try:
+                self.crawl(start_url, on_page=hand_off)
+            except _ConsumerGone:
+                pass
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                while not stop.is_set():
+                    try:
+                        pages.put(done, timeout=_HAND_OFF_POLL)
+                        break
+                    except queue.Full:
+                        pass
+
+        thread = threading.Thread(target=run, name="crawler", daemon=True)
+        thread.start()
 
-        console.print(f"\n[bold green]Crawl complete![/bold green] Fetched {len(self.pages)} pages.")
+        try:
+            while (page_data := pages.get()) is not done:
+                yield page_data
+        finally:
+            stop.set()
 
-        return self.pages
+        thread.join()
+        if errors:
+            raise errors[0]
 
     def close(self):
         """Clean up resources."""
-        self.session.close()
-        if self._browser:
-            self._browser.close()
-        if self._playwright:
-            self._playwright.stop()
+        # HTTP sessions and browsers are scoped to each crawl() call
+        _parse_and_normalize.cache_clear()
+        _canonical_key.cache_clear()
 
     def __enter__(self):
         return self
@@ -1,16 +1,34 @@
 """Content extraction from HTML pages."""
 
+import copy
+import multiprocessing
+import os
 import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterable, Optional
 
-from bs4 import BeautifulSoup, NavigableString
+import lxml.html
+from lxml import etree
 from readability import Document
 
 from .crawler import PageData
 
+# Same settings readability uses, with error recovery for broken markup spelled out
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8", recover=True, huge_tree=False)
 
-@dataclass
+# Compiled once; evaluated against every page
+_META_XPATH = etree.XPath("//meta[@name or @property]")
+_CANONICAL_XPATH = etree.XPath(
+    "//link[contains(concat(' ', normalize-space(@rel), ' '), ' canonical ')]/@href"
+)
+
+# Pages queued per extraction worker; bounds how far extract_all reads ahead
+_PAGES_IN_FLIGHT_PER_WORKER = 4
+
+
+@dataclass(slots=True)
 class ExtractedContent:
     """Extracted and cleaned content from a page."""
     url: str
@@ -39,14 +57,21 @@ class ContentExtractor:
             r"share", r"related", r"advertisement", r"ad-", r"ads-",
             r"cookie", r"popup", r"modal", r"banner"
         ]
+        # Metadata fields and the meta tag names that supply them, in priority order
+        self.meta_mappings = {
+            "description": ["description", "og:description", "twitter:description"],
+            "keywords": ["keywords"],
+            "author": ["author", "article:author"],
+            "published": ["article:published_time", "datePublished"],
+            "modified": ["article:modified_time", "dateModified"],
+        }
+        self._skip_re = re.compile("|".join(self.skip_patterns), re.IGNORECASE)
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text content."""
-        # Replace multiple whitespace with single space
-        text = re.sub(r"\s+", " ", text)
-        # Remove leading/trailing whitespace
-        text = text.strip()
-        return text
+        # Splitting on whitespace runs and rejoining collapses them to single
+        # spaces and trims the ends, without going through the regex engine
+        return " ".join(text.split())
 
     def _should_skip_element(self, element) -> bool:
         """Check if element should be skipped based on class/id."""
@@ -55,34 +80,42 @@ class ContentExtractor:
 
         # Convert to string for pattern matching
         class_str = " ".join(classes) if isinstance(classes, list) else str(classes)
-        check_str = f"{class_str} {element_id}".lower()
+        check_str = f"{class_str} {element_id}"
+
+        return bool(self._skip_re.search(check_str))
 
-        for pattern in self.skip_patterns:
-            if re.search(pattern, check_str, re.IGNORECASE):
-                return True
-        return False
+    def _extract_with_readability(self, root: lxml.html.HtmlElement, url: str) -> tuple[str, str]:
+        """
+        Use readability to extract main content from an already-parsed page.
 
-    def _extract_with_readability(self, html: str, url: str) -> tuple[str, str]:
-        """Use readability to extract main content."""
+        Readability drops hidden elements from the tree it is given, so call this last.
+        """
         try:
-            doc = Document(html)
+            doc = Document(root)
             title = doc.title()
-            content_html = doc.summary()
+            doc.summary()
 
-            # Parse the extracted content
-            soup = BeautifulSoup(content_html, "lxml")
-            content_text = self._clean_text(soup.get_text())
+            # summary() leaves the cleaned article tree in doc.html; read its
+            # text directly instead of reparsing the serialized summary
+            content_text = self._clean_text(doc.html.text_content())
 
             return title, content_text
         except Exception:
             return "", ""
 
-    def _extract_headings(self, soup: BeautifulSoup) -> list[dict]:
+    def _parse(self, html: str) -> lxml.html.HtmlElement:
+        """Parse HTML the same way readability does, so the tree can be shared with it."""
+        return lxml.html.document_fromstring(
+            html.encode("utf-8", "replace"),
+            parser=_HTML_PARSER
+        )
+
+    def _extract_headings(self, root: lxml.html.HtmlElement) -> list[dict]:
         """Extract all headings with their hierarchy."""
         headings = []
         for level in range(1, 7):
-            for heading in soup.find_all(f"h{level}"):
-                text = self._clean_text(heading.get_text())
+            for heading in root.iter(f"h{level}"):
+                text = self._clean_text(heading.text_content())
                 if text:
                     headings.append({
                         "level": level,
@@ -90,40 +123,40 @@ class ContentExtractor:
                     })
         return headings
 
-    def _extract_metadata(self, soup: BeautifulSoup) -> dict:
+    def _extract_metadata(self, root: lxml.html.HtmlElement) -> dict:
         """Extract page metadata from meta tags."""
         metadata = {}
 
-        # Standard meta tags
-        meta_mappings = {
-            "description": ["description", "og:description", "twitter:description"],
-            "keywords": ["keywords"],
-            "author": ["author", "article:author"],
-            "published": ["article:published_time", "datePublished"],
-            "modified": ["article:modified_time", "dateModified"],
-        }
-
-        for key, names in meta_mappings.items():
+        # Collect every meta tag in one pass, keyed by (attribute, value)
+        meta_content = {}
+        for meta in _META_XPATH(root):
+            content = meta.get("content")
+            if not content:
+                continue
+            for attr in ("name", "property"):
+                if meta.get(attr):
+                    meta_content.setdefault((attr, meta.get(attr)), content)
+
+        for key, names in self.meta_mappings.items():
             for name in names:
-                meta = soup.find("meta", attrs={"name": name}) or \
-                       soup.find("meta", attrs={"property": name})
-                if meta and meta.get("content"):
-                    metadata[key] = meta["content"]
+                content = meta_content.get(("name", name)) or meta_content.get(("property", name))
+                if content:
+                    metadata[key] = content
                     break
 
         # Extract canonical URL
-        canonical = soup.find("link", rel="canonical")
-        if canonical and canonical.get("href"):
-            metadata["canonical"] = canonical["href"]
+        canonical = _CANONICAL_XPATH(root)
+        if canonical and canonical[0]:
+            metadata["canonical"] = str(canonical[0])
 
         return metadata
 
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> list[dict]:
+    def _extract_links(self, root: lxml.html.HtmlElement, base_url: str) -> list[dict]:
         """Extract all links with their text."""
         links = []
-        for anchor in soup.find_all("a", href=True):
-            href = anchor["href"]
-            text = self._clean_text(anchor.get_text())
+        for anchor in root.xpath("//a[@href]"):
+            href = anchor.get("href")
+            text = self._clean_text(anchor.text_content())
             if text and not href.startswith(("#", "javascript:", "mailto:")):
                 links.append({
                     "text": text,
@@ -131,15 +164,13 @@ class ContentExtractor:
                 })
         return links
 
-    def _get_raw_text(self, soup: BeautifulSoup) -> str:
-        """Get all text content from the page."""
-        # Remove unwanted tags
-        for tag in self.remove_tags:
-            for element in soup.find_all(tag):
-                element.decompose()
+    def _get_raw_text(self, root: lxml.html.HtmlElement) -> str:
+        """Get all text content from the page. Modifies the tree."""
+        # Remove unwanted tags in a single pass, keeping the text that follows them
+        etree.strip_elements(root, *self.remove_tags, with_tail=False)
 
         # Get text
-        text = soup.get_text(separator=" ")
+        text = " ".join(root.itertext())
         return self._clean_text(text)
 
     def extract(self, page: PageData) -> ExtractedContent:
@@ -154,22 +185,29 @@ class ContentExtractor:
                 title=page.title or "Error loading page"
             )
 
-        soup = BeautifulSoup(page.html, "lxml")
-
-        # Extract using readability for main content
-        readability_title, main_content = self._extract_with_readability(page.html, page.url)
+        # Parse once and share the tree between all extraction steps
+        try:
+            root = self._parse(page.html_text)
+        except etree.ParserError:
+            return ExtractedContent(
+                url=page.url,
+                title=page.title or "Untitled"
+            )
 
         # Extract metadata
-        metadata = self._extract_metadata(soup)
+        metadata = self._extract_metadata(root)
 
         # Extract headings
-        headings = self._extract_headings(soup)
+        headings = self._extract_headings(root)
 
         # Extract links
-        links = self._extract_links(soup, page.url)
+        links = self._extract_links(root, page.url)
+
+        # Get raw text as fallback (from a copy, readability still needs the original)
+        raw_text = self._get_raw_text(copy.deepcopy(root))
 
-        # Get raw text as fallback
-        raw_text = self._get_raw_text(soup)
+        # Extract using readability for main content
+        readability_title, main_content = self._extract_with_readability(root, page.url)
 
         # Use best available title
         title = page.title or readability_title or metadata.get("title", "Untitled")
@@ -185,6 +223,53 @@ class ContentExtractor:
             raw_text=raw_text
         )
 
-    def extract_all(self, pages: list[PageData]) -> list[ExtractedContent]:
-        """Extract content from multiple pages."""
-        return [self.extract(page) for page in pages]
+    def extract_all(
+        self,
+        pages: Iterable[PageData],
+        workers: Optional[int] = None
+    ) -> list[ExtractedContent]:
+        """
+        Extract content from multiple pages in parallel worker processes.
+
+        Pages are submitted as the iterable produces them, so a streaming crawl
+        overlaps with extraction. Results keep the input order.
+        Uses one worker per CPU by default; workers=1 extracts in this process.
+        At most a few pages per worker are in flight at once, so a streaming
+        source is only read as fast as pages are extracted.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers == 1:
+            return [self.extract(page) for page in pages]
+
+        # Spawn rather than fork: the crawler may be running in another thread
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self,)
+        ) as executor:
+            # Executor.map would drain the whole iterable up front; keep a bounded window instead
+            window = workers * _PAGES_IN_FLIGHT_PER_WORKER
+            in_flight: deque[Future] = deque()
+            results = []
+            for page in pages:
+                if len(in_flight) >= window:
+                    results.append(in_flight.popleft().result())
+                in_flight.append(executor.submit(_extract_in_worker, page))
+            results.extend(future.result() for future in in_flight)
+            return results
+
+
+# Extractor used by each worker process, set once by _init_worker
+_worker_extractor: Optional[ContentExtractor] = None
+
+
+def _init_worker(extractor: ContentExtractor):
+    """Store the extractor in a worker process."""
+    global _worker_extractor
+    _worker_extractor = extractor
+
+
+def _extract_in_worker(page: PageData) -> ExtractedContent:
+    """Extract a single page inside a worker process."""
+    return _worker_extractor.extract(page)
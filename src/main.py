@@ -22,6 +22,17 @@ from .output import MarkdownGenerator
 console = Console()
 
 
+def positive_int(value: str) -> int:
+    """Argparse type for integer options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -71,7 +82,7 @@ Examples:
         "--delay",
         type=float,
         default=1.0,
-        help="Delay between requests in seconds (default: 1.0)"
+        help="Delay between requests to the same host in seconds (default: 1.0)"
     )
 
     parser.add_argument(
@@ -81,6 +92,13 @@ Examples:
         help="Request timeout in seconds (default: 30)"
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=64,
+        help="Maximum number of simultaneous requests (default: 64)"
+    )
+
     parser.add_argument(
         "--js",
         action="store_true",
@@ -126,29 +144,27 @@ def main():
         max_depth=args.max_depth,
         delay=args.delay,
         timeout=args.timeout,
-        use_js=args.js
+        use_js=args.js,
+        concurrency=args.concurrency
     )
 
     generated_files = []
 
     try:
-        # Step 1: Crawl
-        console.print("\n[bold cyan]Step 1: Crawling website...[/bold cyan]")
+        # Step 1: Crawl, extracting content from each page as it arrives
+        console.print("\n[bold cyan]Step 1: Crawling website and extracting content...[/bold cyan]")
+        extractor = ContentExtractor()
         with WebCrawler(config) as crawler:
-            pages = crawler.crawl(args.url)
+            content = extractor.extract_all(crawler.iter_crawl(args.url))
 
-        if not pages:
+        if not content:
             console.print("[red]Error: No pages were successfully crawled.[/red]")
             sys.exit(1)
 
-        # Step 2: Extract content
-        console.print("\n[bold cyan]Step 2: Extracting content...[/bold cyan]")
-        extractor = ContentExtractor()
-        content = extractor.extract_all(pages)
         console.print(f"[green]Extracted content from {len(content)} pages.[/green]")
 
-        # Step 3: Generate outputs
-        console.print("\n[bold cyan]Step 3: Generating outputs...[/bold cyan]")
+        # Step 2: Generate outputs
+        console.print("\n[bold cyan]Step 2: Generating outputs...[/bold cyan]")
         output_gen = MarkdownGenerator(args.output)
 
         # Always generate raw dump (org name extracted automatically from page titles)
@@ -158,7 +174,7 @@ def main():
 
         # Generate Q&A summary if questions provided
         if not args.dump_only and args.questions:
-            console.print("\n[bold cyan]Step 4: Generating Q&A summary...[/bold cyan]")
+            console.print("\n[bold cyan]Step 3: Generating Q&A summary...[/bold cyan]")
             summarizer = Summarizer()
             summary = summarizer.summarize(content, args.questions)
 
@@ -192,7 +208,7 @@ def main():
         # Final summary
         console.print(Panel.fit(
             f"[bold green]Scraping complete![/bold green]\n\n"
-            f"Pages crawled: {len(pages)}\n"
+            f"Pages crawled: {len(content)}\n"
             f"Files generated: {len(generated_files) + 1}\n"
             f"Output directory: {args.output.absolute()}",
             title="Complete"
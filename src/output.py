@@ -1,28 +1,54 @@
 """Markdown output generation for scraped content and summaries."""
 
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Union
+from typing import Iterator, Union
 
 from .extractor import ExtractedContent
 from .summarizer import Summary
 
+# Reports are streamed through a large write buffer instead of being built in memory
+_WRITE_BUFFER = 1 << 20
+
+# Characters that are invalid in filenames on common platforms
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+# Common separators in page titles
+_TITLE_SEPARATOR_RE = re.compile(r" - | \| | :: | : | — | – ")
+
+# Common page type prefixes/suffixes to ignore when looking for the org name
+_PAGE_TYPES = frozenset({
+    'home', 'about', 'about us', 'contact', 'contact us',
+    'products', 'services', 'blog', 'news', 'team', 'careers',
+    'faq', 'help', 'support', 'login', 'sign in', 'register'
+})
+
+# Markdown list indent per heading level (h1-h6)
+_INDENTS = tuple("  " * i for i in range(6))
+
+# One raw-dump page; optional sections are pre-rendered blocks or empty strings
+_RAW_PAGE_TEMPLATE = (
+    "\n## Page {number}: {title}\n\n"
+    "**URL:** {url}\n\n"
+    "{description}{metadata}{headings}{content}"
+    "---\n"
+)
+
 
 class MarkdownGenerator:
     """Generates markdown files from scraped content and summaries."""
 
+    __slots__ = ("output_dir",)
+
     def __init__(self, output_dir: Union[str, Path] = "output"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize string for use as filename."""
-        # Remove/replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, "_")
-        # Limit length and strip whitespace
-        return name.strip()[:100]
+        # Replace invalid characters, strip whitespace and limit length
+        return name.translate(_SANITIZE_TABLE).strip()[:100]
 
     def _extract_org_name(self, titles: list[str]) -> str:
         """
@@ -36,46 +62,23 @@ class MarkdownGenerator:
         if not titles:
             return "website"
 
-        # Common separators in page titles
-        separators = [' - ', ' | ', ' :: ', ' : ', ' — ', ' – ']
-
-        # Common page type prefixes/suffixes to ignore
-        page_types = {
-            'home', 'about', 'about us', 'contact', 'contact us',
-            'products', 'services', 'blog', 'news', 'team', 'careers',
-            'faq', 'help', 'support', 'login', 'sign in', 'register'
-        }
-
-        # Try to find common part across multiple titles
-        candidates = []
-
-        for title in titles[:5]:  # Check first 5 pages
+        # Count candidate name parts across the first 5 pages
+        counts: dict[str, int] = {}
+        for title in titles[:5]:
             if not title:
                 continue
 
-            # Split by separators and find the org name part
-            parts = [title]
-            for sep in separators:
-                new_parts = []
-                for part in parts:
-                    new_parts.extend(part.split(sep))
-                parts = new_parts
-
             # Filter out page type words, keep likely org names
-            for part in parts:
+            for part in _TITLE_SEPARATOR_RE.split(title):
                 part = part.strip()
-                if part.lower() not in page_types and len(part) > 2:
-                    candidates.append(part)
+                if len(part) > 2 and part.lower() not in _PAGE_TYPES:
+                    counts[part] = counts.get(part, 0) + 1
 
-        if not candidates:
+        if not counts:
             return titles[0] if titles else "website"
 
-        # Find the most common candidate (likely the org name)
-        from collections import Counter
-        counts = Counter(candidates)
-        most_common = counts.most_common(1)[0][0]
-
-        return most_common
+        # The most common candidate is likely the org name; ties go to the first seen
+        return max(counts, key=counts.get)
 
     def generate_summary_report(self, summary: Summary) -> Path:
         """
@@ -85,88 +88,97 @@ class MarkdownGenerator:
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         site_name = self._sanitize_filename(summary.site_title) or "website"
+        output_path = self.output_dir / f"{site_name} - Summary.md"
 
-        lines = [
-            f"# Website Summary: {summary.site_title}",
-            "",
-            f"**URL:** {summary.site_url}",
-            f"**Pages Crawled:** {summary.total_pages}",
-            f"**Generated:** {timestamp}",
-            "",
-            "---",
-            "",
-        ]
+        # Each section opens with the blank line separating it from the previous one
+        with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+            f.write(
+                f"# Website Summary: {summary.site_title}\n\n"
+                f"**URL:** {summary.site_url}\n"
+                f"**Pages Crawled:** {summary.total_pages}\n"
+                f"**Generated:** {timestamp}\n\n"
+                "---\n"
+            )
 
-        # Questions and Answers section
-        if summary.answers:
-            lines.extend([
-                "## Questions & Answers",
-                "",
-            ])
-
-            for i, qa in enumerate(summary.answers, 1):
-                confidence_emoji = {
-                    "high": "[checkmark]",
-                    "medium": "[partial]",
-                    "low": "[?]"
-                }.get(qa.confidence, "")
-
-                lines.extend([
-                    f"### {i}. {qa.question}",
-                    "",
-                    qa.answer,
-                    "",
-                ])
-
-                if qa.sources:
-                    lines.append("**Sources:**")
-                    for source in qa.sources:
-                        lines.append(f"- {source}")
-                    lines.append("")
-
-                lines.extend([
-                    f"*Confidence: {qa.confidence}*",
-                    "",
-                    "---",
-                    "",
-                ])
-
-        # Page summaries section
-        if summary.page_summaries:
-            lines.extend([
-                "## Pages Crawled",
-                "",
-            ])
-
-            for page in summary.page_summaries:
-                lines.extend([
-                    f"### {page['title'] or 'Untitled Page'}",
-                    "",
-                    f"**URL:** {page['url']}",
-                    "",
-                ])
-
-                if page.get('description'):
-                    lines.extend([
-                        page['description'],
-                        "",
-                    ])
-
-                if page.get('headings'):
-                    lines.append("**Key sections:**")
-                    for heading in page['headings']:
-                        lines.append(f"- {heading}")
-                    lines.append("")
-
-                lines.append("---")
-                lines.append("")
+            # Questions and Answers section
+            if summary.answers:
+                f.write("\n## Questions & Answers\n")
 
-        # Write to file
-        output_path = self.output_dir / f"{site_name} - Summary.md"
-        output_path.write_text("\n".join(lines), encoding="utf-8")
+                for i, qa in enumerate(summary.answers, 1):
+                    f.write(f"\n### {i}. {qa.question}\n\n{qa.answer}\n")
+
+                    if qa.sources:
+                        f.write("\n**Sources:**\n")
+                        for source in qa.sources:
+                            f.write(f"- {source}\n")
+
+                    f.write(f"\n*Confidence: {qa.confidence}*\n\n---\n")
+
+            # Page summaries section
+            if summary.page_summaries:
+                f.write("\n## Pages Crawled\n")
+
+                for page in summary.page_summaries:
+                    f.write(f"\n### {page['title'] or 'Untitled Page'}\n\n**URL:** {page['url']}\n")
+
+                    if page.get('description'):
+                        f.write(f"\n{page['description']}\n")
+
+                    if page.get('headings'):
+                        f.write("\n**Key sections:**\n")
+                        for heading in page['headings']:
+                            f.write(f"- {heading}\n")
+
+                    f.write("\n---\n")
 
         return output_path
 
+    def _format_raw_page(self, number: int, page: ExtractedContent) -> str:
+        """Render one page of the raw dump as a single string."""
+        description = metadata = headings = content = ""
+
+        if page.description:
+            description = f"### Description\n\n{page.description}\n\n"
+
+        if page.metadata:
+            items = [f"- **{key}:** {value}" for key, value in page.metadata.items()]
+            metadata = "### Metadata\n\n" + "\n".join(items) + "\n\n"
+
+        if page.headings:
+            items = [f"{_INDENTS[min(heading['level'] - 1, 5)]}- {heading['text']}" for heading in page.headings]
+            headings = "### Headings\n\n" + "\n".join(items) + "\n\n"
+
+        if page.main_content:
+            content = f"### Content\n\n{page.main_content}\n\n"
+
+        return _RAW_PAGE_TEMPLATE.format(
+            number=number,
+            title=page.title or "Untitled",
+            url=page.url,
+            description=description,
+            metadata=metadata,
+            headings=headings,
+            content=content,
+        )
+
+    def _iter_raw_dump_chunks(
+        self,
+        content: list[ExtractedContent],
+        site_name: str,
+        timestamp: str
+    ) -> Iterator[str]:
+        """Yield the raw dump's header and then one rendered block per page."""
+        yield (
+            f"# Full Content Dump: {site_name}\n\n"
+            f"**Total Pages:** {len(content)}\n"
+            f"**Generated:** {timestamp}\n\n"
+            "---\n"
+        )
+
+        # Each page opens with the blank line separating it from the previous one
+        for i, page in enumerate(content, 1):
+            yield self._format_raw_page(i, page)
+
     def generate_raw_dump(self, content: list[ExtractedContent], site_name: str = None) -> Path:
         """
         Generate a complete dump of all extracted content.
@@ -182,67 +194,9 @@ class MarkdownGenerator:
 
         site_name = self._sanitize_filename(site_name)
 
-        lines = [
-            f"# Full Content Dump: {site_name}",
-            "",
-            f"**Total Pages:** {len(content)}",
-            f"**Generated:** {timestamp}",
-            "",
-            "---",
-            "",
-        ]
-
-        for i, page in enumerate(content, 1):
-            lines.extend([
-                f"## Page {i}: {page.title or 'Untitled'}",
-                "",
-                f"**URL:** {page.url}",
-                "",
-            ])
-
-            if page.description:
-                lines.extend([
-                    "### Description",
-                    "",
-                    page.description,
-                    "",
-                ])
-
-            if page.metadata:
-                lines.extend([
-                    "### Metadata",
-                    "",
-                ])
-                for key, value in page.metadata.items():
-                    lines.append(f"- **{key}:** {value}")
-                lines.append("")
-
-            if page.headings:
-                lines.extend([
-                    "### Headings",
-                    "",
-                ])
-                for heading in page.headings:
-                    indent = "  " * (heading["level"] - 1)
-                    lines.append(f"{indent}- {heading['text']}")
-                lines.append("")
-
-            if page.main_content:
-                lines.extend([
-                    "### Content",
-                    "",
-                    page.main_content,
-                    "",
-                ])
-
-            lines.extend([
-                "---",
-                "",
-            ])
-
-        # Write to file
         output_path = self.output_dir / f"{site_name}.md"
-        output_path.write_text("\n".join(lines), encoding="utf-8")
+        with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+            f.writelines(self._iter_raw_dump_chunks(content, site_name, timestamp))
 
         return output_path
 
@@ -1,14 +1,84 @@
 """Summarizer that answers questions based on extracted content."""
 
+import copy
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Iterable, Iterator, Optional, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from .extractor import ExtractedContent
 
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"\b\w{4,}\b")
+
+# Below this many corpus characters × questions, answer serially. Starting a pool
+# costs 0.4-0.9s (each spawned worker re-imports the package and unpickles the
+# page cache) and serial answering runs at 50-160ns per unit, so two workers only
+# pay off from roughly 2s of serial work at the cheap end
+_PARALLEL_MIN_WORK = 40_000_000
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int):
+    """
+    Parse a YAML file once per (path, modification time).
+
+    The mtime is only part of the cache key, so edits to the file are picked up.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> Optional[re.Pattern]:
+    """Compile keywords into one case-insensitive alternation, or None if there are none."""
+    keywords = list(keywords)
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+def _iter_sentences(text: str) -> Iterator[str]:
+    """
+    Yield the sentences of `text`, as re.split on sentence boundaries would.
+
+    Sentences are sliced out lazily, so callers that stop early never split the rest.
+    """
+    start = 0
+    for boundary in _SENTENCE_BOUNDARY_RE.finditer(text):
+        yield text[start:boundary.start()]
+        start = boundary.end()
+    yield text[start:]
+
+
+def _dedup_keep_order(
+    items: Iterable[str],
+    limit: int,
+    key: Optional[Callable[[str], str]] = None
+) -> list[str]:
+    """Return up to `limit` distinct items in first-seen order, compared by `key` if given."""
+    seen = set()
+    unique = []
+    for item in items:
+        item_key = key(item) if key else item
+        if item_key not in seen:
+            seen.add(item_key)
+            unique.append(item)
+            if len(unique) == limit:
+                break
+    return unique
+
 
 @dataclass
 class QuestionAnswer:
@@ -29,12 +99,54 @@ class Summary:
     page_summaries: list[dict] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class _PageText:
+    """The parts of a page that question answering reads, prepared once per summary."""
+    url: str
+    text: str  # main content, or raw text when there is none
+    combined: str  # main content and raw text, space separated
+    raw_start: int  # offset of the raw text within combined
+    headings: tuple[str, ...]
+
+    @classmethod
+    def from_content(cls, content: ExtractedContent) -> "_PageText":
+        return cls(
+            url=content.url,
+            text=content.main_content or content.raw_text,
+            combined=content.main_content + " " + content.raw_text,
+            raw_start=len(content.main_content) + 1,
+            headings=tuple(heading["text"] for heading in content.headings),
+        )
+
+    @property
+    def raw_text(self) -> str:
+        return self.combined[self.raw_start:]
+
+
+def _join_corpus(page_cache: list[_PageText]) -> str:
+    """Combined text of every page, searched by the pattern-based answers."""
+    return "\n".join([page.combined for page in page_cache])
+
+
 class Summarizer:
     """Extracts answers to questions from website content."""
 
+    # Question words that indicate a pattern-based answer
+    _PATTERN_KEYWORDS = {
+        "email": ["email", "mail", "contact"],
+        "phone": ["phone", "call", "telephone", "number"],
+        "address": ["address", "location", "where", "office"],
+        "price": ["price", "cost", "pricing", "subscription"],
+    }
+
+    # Question words too generic to search for
+    _STOP_WORDS = frozenset({
+        "what", "which", "where", "when", "does", "this", "that", "have", "with", "from", "about", "their"
+    })
+
     def __init__(self):
-        # Patterns for common data types
-        self.patterns = {
+        # Patterns for common data types, compiled once
+        patterns = {
             "email": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
             "phone": r"(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}",
             "address": r"\d+\s+[\w\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct)\.?(?:\s*,\s*[\w\s]+)?(?:\s*,\s*[A-Z]{2}\s*\d{5})?",
@@ -42,6 +154,7 @@ class Summarizer:
             "price": r"\$[\d,]+(?:\.\d{2})?",
             "year": r"\b(?:19|20)\d{2}\b",
         }
+        self.patterns = {name: re.compile(p, re.IGNORECASE) for name, p in patterns.items()}
 
         # Keywords that indicate specific content types
         self.content_indicators = {
@@ -52,6 +165,14 @@ class Summarizer:
             "about": ["about", "who we are", "our story", "history", "founded"],
             "pricing": ["pricing", "price", "cost", "plan", "subscription", "free", "premium"],
         }
+        # One alternation per category, so a question is scanned once per category
+        self._category_patterns = {
+            category: _keyword_pattern(indicators)
+            for category, indicators in self.content_indicators.items()
+        }
+
+        # question -> (pattern type, keyword pattern, section heading pattern)
+        self._question_cache: dict[str, tuple[Optional[str], Optional[re.Pattern], Optional[re.Pattern]]] = {}
 
     def load_questions(self, config_path: Union[str, Path]) -> dict:
         """Load questions from YAML config file."""
@@ -59,40 +180,41 @@ class Summarizer:
         if not config_path.exists():
             raise FileNotFoundError(f"Questions config not found: {config_path}")
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-
-        return config
+        # Copy so callers can't alter the cached config
+        config = _load_yaml_cached(str(config_path.resolve()), config_path.stat().st_mtime_ns)
+        return copy.deepcopy(config)
 
     def _extract_pattern(self, pattern_name: str, text: str) -> list[str]:
         """Extract all matches for a named pattern."""
         if pattern_name not in self.patterns:
             return []
 
-        matches = re.findall(self.patterns[pattern_name], text, re.IGNORECASE)
+        matches = self.patterns[pattern_name].findall(text)
         # Deduplicate while preserving order
         seen = set()
         unique = []
         for m in matches:
-            if m.lower() not in seen:
-                seen.add(m.lower())
+            key = m.lower()
+            if key not in seen:
+                seen.add(key)
                 unique.append(m)
         return unique
 
     def _find_relevant_sentences(
         self,
         text: str,
-        keywords: list[str],
+        keyword_re: re.Pattern,
         max_sentences: int = 5
     ) -> list[str]:
-        """Find sentences containing any of the keywords."""
-        # Split into sentences
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        """
+        Find sentences matching the compiled keyword alternation.
 
+        One case-insensitive scan per sentence, rather than a lowercased copy and
+        a lookup per keyword.
+        """
         relevant = []
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            if any(kw.lower() in sentence_lower for kw in keywords):
+        for sentence in _iter_sentences(text):
+            if keyword_re.search(sentence):
                 cleaned = sentence.strip()
                 if len(cleaned) > 20 and len(cleaned) < 500:
                     relevant.append(cleaned)
@@ -101,111 +223,116 @@ class Summarizer:
 
         return relevant
 
-    def _extract_section_content(
-        self,
-        content: ExtractedContent,
-        heading_keywords: list[str]
-    ) -> str:
-        """Extract content under headings matching keywords."""
-        # Find relevant headings
-        relevant_headings = []
-        for heading in content.headings:
-            heading_lower = heading["text"].lower()
-            if any(kw.lower() in heading_lower for kw in heading_keywords):
-                relevant_headings.append(heading["text"])
+    def _extract_section_content(self, page: _PageText, heading_re: re.Pattern) -> str:
+        """Extract content under headings matching the compiled keyword alternation."""
+        # Find relevant headings with one case-insensitive scan each, without lowercased copies
+        relevant_headings = [heading for heading in page.headings if heading_re.search(heading)]
 
         if not relevant_headings:
             return ""
 
+        raw_text = page.raw_text
+
         # Try to find content near these headings in raw text
         results = []
         for heading in relevant_headings:
             # Find the heading in raw text and get following content
             pattern = re.escape(heading) + r"[:\s]*(.{50,500}?)(?=\n\n|$)"
-            matches = re.findall(pattern, content.raw_text, re.IGNORECASE | re.DOTALL)
+            matches = re.findall(pattern, raw_text, re.IGNORECASE | re.DOTALL)
             results.extend(matches)
 
         return " ".join(results[:3])
 
-    def _answer_question(
+    def _analyze_question(
         self,
-        question: str,
-        all_content: list[ExtractedContent]
-    ) -> QuestionAnswer:
-        """Generate an answer for a question from content."""
-        question_lower = question.lower()
-        sources = []
-        answer_parts = []
+        question: str
+    ) -> tuple[Optional[str], Optional[re.Pattern], Optional[re.Pattern]]:
+        """
+        Derive the pattern type and compiled keyword and section heading patterns for a question.
 
-        # Check for pattern-based questions
-        pattern_keywords = {
-            "email": ["email", "mail", "contact"],
-            "phone": ["phone", "call", "telephone", "number"],
-            "address": ["address", "location", "where", "office"],
-            "price": ["price", "cost", "pricing", "subscription"],
-        }
+        None of these depend on page content, so they are cached per question.
+        The patterns are None when the question yields no keywords.
+        """
+        cached = self._question_cache.get(question)
+        if cached is not None:
+            return cached
+
+        question_lower = question.lower()
 
         # Detect if this is a pattern question
         pattern_type = None
-        for ptype, keywords in pattern_keywords.items():
-            if any(kw in question_lower for kw in keywords):
+        for ptype, words in self._PATTERN_KEYWORDS.items():
+            if any(word in question_lower for word in words):
                 pattern_type = ptype
                 break
 
-        # Combine all text
-        all_text = "\n".join([c.main_content + " " + c.raw_text for c in all_content])
+        # Extract keywords from question
+        keywords = [w for w in _WORD_RE.findall(question_lower) if w not in self._STOP_WORDS]
+        keyword_re = _keyword_pattern(keywords)
+        section_re = _keyword_pattern(self._get_section_keywords(question_lower))
+
+        result = (pattern_type, keyword_re, section_re)
+        self._question_cache[question] = result
+        return result
+
+    def _find_source_pages(self, matches: list[str], page_cache: list[_PageText]) -> list[str]:
+        """
+        URLs of pages whose combined text contains any of the matches.
+
+        The escaped matches are compiled into one alternation, so each page is
+        scanned once rather than once per match.
+        """
+        match_re = re.compile("|".join(map(re.escape, matches)))
+        return [page.url for page in page_cache if match_re.search(page.combined)]
+
+    def _answer_question(
+        self,
+        question: str,
+        all_text: str,
+        page_cache: list[_PageText]
+    ) -> QuestionAnswer:
+        """
+        Generate an answer for a question from content.
+
+        `all_text` is the combined text of every page and `page_cache` holds the
+        prepared text of each page; both are built once per summary.
+        """
+        pattern_type, keyword_re, section_re = self._analyze_question(question)
+        sources = []
+        answer_parts = []
 
         # Pattern-based extraction
         if pattern_type:
             matches = self._extract_pattern(pattern_type, all_text)
             if matches:
                 answer_parts.extend(matches[:5])
-                # Find source pages
-                for content in all_content:
-                    combined = content.main_content + " " + content.raw_text
-                    if any(m in combined for m in matches):
-                        sources.append(content.url)
+                sources.extend(self._find_source_pages(matches, page_cache))
 
-        # Keyword-based extraction
-        # Extract keywords from question
-        question_words = re.findall(r"\b\w{4,}\b", question_lower)
-        stop_words = {"what", "which", "where", "when", "does", "this", "that", "have", "with", "from", "about", "their"}
-        keywords = [w for w in question_words if w not in stop_words]
-
-        # Find relevant sentences
-        if keywords:
-            for content in all_content:
-                sentences = self._find_relevant_sentences(
-                    content.main_content or content.raw_text,
-                    keywords,
-                    max_sentences=3
-                )
+        # Keyword-based extraction: find relevant sentences
+        if keyword_re:
+            for page in page_cache:
+                sentences = self._find_relevant_sentences(page.text, keyword_re, max_sentences=3)
                 if sentences:
                     answer_parts.extend(sentences)
-                    sources.append(content.url)
+                    sources.append(page.url)
 
         # Also check for section-based content
-        section_keywords = self._get_section_keywords(question_lower)
-        if section_keywords:
-            for content in all_content:
-                section_content = self._extract_section_content(content, section_keywords)
+        if section_re:
+            for page in page_cache:
+                section_content = self._extract_section_content(page, section_re)
                 if section_content:
                     answer_parts.append(section_content)
-                    if content.url not in sources:
-                        sources.append(content.url)
+                    if page.url not in sources:
+                        sources.append(page.url)
 
         # Compile answer
         if answer_parts:
-            # Deduplicate and format
-            unique_parts = []
-            seen = set()
-            for part in answer_parts:
-                part_normalized = part.lower().strip()[:100]
-                if part_normalized not in seen:
-                    seen.add(part_normalized)
-                    unique_parts.append(part.strip())
-
-            answer = "\n\n".join(unique_parts[:5])
+            # Deduplicate on a lowercased 100-character prefix and format
+            unique_parts = _dedup_keep_order(
+                (part.strip() for part in answer_parts), 5, key=lambda part: part[:100].lower()
+            )
+
+            answer = "\n\n".join(unique_parts)
             confidence = "high" if len(unique_parts) >= 3 else "medium" if len(unique_parts) >= 1 else "low"
         else:
             answer = "No relevant information found."
@@ -214,23 +341,23 @@ class Summarizer:
         return QuestionAnswer(
             question=question,
             answer=answer,
-            sources=list(set(sources))[:3],
+            sources=_dedup_keep_order(sources, 3),
             confidence=confidence
         )
 
     def _get_section_keywords(self, question: str) -> list[str]:
         """Get section keywords based on question content."""
-        for category, indicators in self.content_indicators.items():
-            if any(ind in question for ind in indicators):
-                return indicators
+        for category, pattern in self._category_patterns.items():
+            if pattern.search(question):
+                return self.content_indicators[category]
         return []
 
     def _create_page_summary(self, content: ExtractedContent) -> dict:
         """Create a brief summary for a single page."""
         # Get first few sentences of content
         text = content.main_content or content.raw_text
-        sentences = re.split(r"(?<=[.!?])\s+", text)
-        summary_sentences = [s.strip() for s in sentences[:3] if len(s.strip()) > 20]
+        sentences = islice(_iter_sentences(text), 3)
+        summary_sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
 
         return {
             "url": content.url,
@@ -242,14 +369,18 @@ class Summarizer:
     def summarize(
         self,
         content: list[ExtractedContent],
-        questions_config: Union[dict, str, Path]
+        questions_config: Union[dict, str, Path],
+        workers: Optional[int] = None
     ) -> Summary:
         """
         Generate a summary answering all questions from the config.
 
+        Large summaries answer questions in parallel worker processes.
+
         Args:
             content: List of extracted content from pages
             questions_config: Either a dict of questions or path to YAML file
+            workers: Worker processes for answering (default one per CPU; 1 runs serially)
 
         Returns:
             Summary object with answers and page summaries
@@ -261,18 +392,33 @@ class Summarizer:
             questions = questions_config
 
         # Flatten nested questions
-        flat_questions = []
-        self._flatten_questions(questions, flat_questions)
+        flat_questions = self._flatten_questions(questions)
 
         # Get site info
         site_url = content[0].url if content else ""
         site_title = content[0].title if content else "Unknown Site"
 
+        # Combine page text once rather than per question
+        page_cache = [_PageText.from_content(c) for c in content]
+        all_text = _join_corpus(page_cache)
+
         # Answer each question
-        answers = []
-        for question in flat_questions:
-            answer = self._answer_question(question, content)
-            answers.append(answer)
+        workers = min(workers or os.cpu_count() or 1, len(flat_questions))
+        if workers <= 1 or len(all_text) * len(flat_questions) < _PARALLEL_MIN_WORK:
+            answers = []
+            for question in flat_questions:
+                answer = self._answer_question(question, all_text, page_cache)
+                answers.append(answer)
+        else:
+            # Each worker receives the page cache once and rebuilds the corpus from it;
+            # after that only questions and answers cross over
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self, page_cache)
+            ) as executor:
+                answers = list(executor.map(_answer_in_worker, flat_questions))
 
         # Create page summaries
         page_summaries = [self._create_page_summary(c) for c in content]
@@ -285,13 +431,37 @@ class Summarizer:
             page_summaries=page_summaries
         )
 
-    def _flatten_questions(self, obj: Union[dict, list, str], result: list, prefix: str = ""):
-        """Flatten nested question structure into a list of question strings."""
-        if isinstance(obj, str):
-            result.append(obj)
-        elif isinstance(obj, list):
-            for item in obj:
-                self._flatten_questions(item, result, prefix)
-        elif isinstance(obj, dict):
-            for key, value in obj.items():
-                self._flatten_questions(value, result, f"{prefix}{key}.")
+    def _flatten_questions(self, root: Union[dict, list, str]) -> list[str]:
+        """
+        Flatten nested question structure into a list of question strings.
+
+        Walks the structure with an explicit stack, so arbitrarily deep configs
+        don't hit the recursion limit. Questions keep their document order.
+        """
+        result = []
+        stack = [root]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, str):
+                result.append(obj)
+            elif isinstance(obj, list):
+                stack.extend(reversed(obj))
+            elif isinstance(obj, dict):
+                stack.extend(reversed(obj.values()))
+        return result
+
+
+# Summarizer and corpus used by each worker process, set once by _init_worker
+_worker_state: Optional[tuple[Summarizer, str, list[_PageText]]] = None
+
+
+def _init_worker(summarizer: Summarizer, page_cache: list[_PageText]):
+    """Store the summarizer and corpus in a worker process."""
+    global _worker_state
+    _worker_state = (summarizer, _join_corpus(page_cache), page_cache)
+
+
+def _answer_in_worker(question: str) -> QuestionAnswer:
+    """Answer a single question inside a worker process."""
+    summarizer, all_text, page_cache = _worker_state
+    return summarizer._answer_question(question, all_text, page_cache)